@@ -11,29 +11,47 @@ Pulls data from:
   - YouTube Data API (TCG video mentions)
   - PokeBeach / PokemonBlog / Pokemon.com (leak news via RSS + scraping)
 
-Run:  pip install flask flask-cors requests feedparser beautifulsoup4
-      python backend.py
+Run:  pip install flask flask-cors requests feedparser beautifulsoup4 lxml cachetools orjson numpy pyahocorasick requests-cache waitress
+      python backend.py                 (waitress, SERVER_THREADS request threads)
+      SERVER=flask python backend.py    (Flask dev server; FLASK_DEBUG=1 adds debugger/reloader)
+  or: gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 backend:app
 
 Then update the React frontend to fetch from http://localhost:5000/api/*
 """
 
 import os
+import atexit
+import copy
 import json
 import time
 import hashlib
 import re
+import sys
 import logging
+import threading
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timedelta
 from typing import Optional
-from dataclasses import dataclass, field, asdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import ahocorasick
+import numpy as np
+import orjson
 import requests
-import feedparser
-from bs4 import BeautifulSoup
-from flask import Flask, jsonify, request
+import requests_cache
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+# bs4 and feedparser are imported inside the scrape helpers that use them, so
+# workers that only serve price/sentiment endpoints never load them.
+
 # ─── Config ──────────────────────────────────────────────────────────────────
 
 LOG = logging.getLogger("pokealpha")
@@ -48,27 +66,157 @@ YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
 
 CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))  # 5 min default
 PORT = int(os.getenv("PORT", "5000"))
+SERVER = os.getenv("SERVER", "waitress")  # "waitress" (threaded WSGI) or "flask" (dev server)
+SERVER_THREADS = int(os.getenv("SERVER_THREADS", "16"))
+DEBUG = os.getenv("FLASK_DEBUG", "0") == "1"  # debugger + reloader, dev server only
+# SQLite file for upstream responses — next to this module, not in the CWD
+HTTP_CACHE = os.getenv("HTTP_CACHE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "pokealpha_http"))
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read) seconds, each spent at most twice / once (see HTTP_RETRY)
+MAX_SCRAPE_BYTES = int(os.getenv("MAX_SCRAPE_BYTES", str(2 * 1024 * 1024)))  # per scraped page
+
+# ─── HTTP sessions ───────────────────────────────────────────────────────────
+#
+# One pooled keep-alive session per header profile, so repeat calls to the same
+# host reuse the TCP/TLS connection instead of re-handshaking every request.
+# Responses go through a shared HTTP cache that honors Cache-Control/ETag and
+# serves stale copies when an upstream is down.
+
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Per-host expiry when the upstream sends no Cache-Control of its own. Scraped
+# HTML pages are MB-sized and streamed with a byte cap (see _read_capped), and
+# YouTube searches carry a per-second publishedAfter, so neither is stored.
+HTTP_CACHE_TTLS = {
+    "api.pokemontcg.io": timedelta(hours=24),  # card DB; prices refresh daily
+    "api.poketrace.com": timedelta(seconds=CACHE_TTL),
+    "pokemonblog.com": requests_cache.DO_NOT_CACHE,  # polled with its own conditional GETs
+    "www.googleapis.com": requests_cache.DO_NOT_CACHE,
+    "www.ebay.com": requests_cache.DO_NOT_CACHE,
+    "www.pokebeach.com": requests_cache.DO_NOT_CACHE,
+    "www.pokemon.com": requests_cache.DO_NOT_CACHE,
+    "www.pricecharting.com": requests_cache.DO_NOT_CACHE,  # key goes in `t`, which Reddit uses too
+}
+
+# YouTube's `key` query param is kept out of the cache file along with
+# requests-cache's default auth params/headers. Ignored params apply to every
+# host, so PriceCharting's `t` key is handled by not caching that host instead.
+HTTP_CACHE_IGNORED_PARAMS = (*requests_cache.DEFAULT_IGNORED_PARAMS, "key")
+
+
+# Retries for transient upstream errors. Timeouts are not multiplied: a connect
+# timeout is retried once and a read timeout never (a hung upstream holds the
+# worker for one HTTP_TIMEOUT read, not four), and Retry-After waits are capped.
+HTTP_RETRY = Retry(
+    total=3,
+    connect=1,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    retry_after_max=2,
+)
+
+
+def _make_session(user_agent: str) -> requests.Session:
+    """Build a pooled, HTTP-cached session with retries on transient upstream errors."""
+    session = requests_cache.CachedSession(
+        HTTP_CACHE,
+        backend="sqlite",
+        expire_after=timedelta(seconds=CACHE_TTL),
+        urls_expire_after=HTTP_CACHE_TTLS,
+        ignored_parameters=HTTP_CACHE_IGNORED_PARAMS,
+        cache_control=True,
+        stale_if_error=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=HTTP_RETRY,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": user_agent})
+    return session
+
+
+SESSION = _make_session("Mozilla/5.0 (compatible; PokéAlpha/1.0)")
+EBAY_SESSION = _make_session(BROWSER_USER_AGENT)  # eBay serves bot UAs a stripped page
+
+# requests-cache never evicts on its own (stale_if_error keeps expired rows on
+# purpose), so drop what earlier runs left behind; both sessions share the file
+SESSION.cache.delete(expired=True)
+
+# Upstream bodies are parsed with orjson; point this at json.loads to fall back
+_json_loads = orjson.loads
+
+
+def _read_capped(resp: requests.Response, limit: int = MAX_SCRAPE_BYTES) -> str:
+    """Decode at most `limit` bytes of a streamed HTML page, dropping the rest.
+
+    Only stops the download early for hosts the HTTP cache skips (DO_NOT_CACHE
+    in HTTP_CACHE_TTLS) — a cached response is read in full before it returns.
+    """
+    chunks = []
+    size = 0
+    try:
+        for chunk in resp.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                LOG.warning(f"Truncated {resp.url} at {limit} bytes")
+                break
+    finally:
+        resp.close()
+    return b"".join(chunks)[:limit].decode(resp.encoding or "utf-8", errors="replace")
+
+
+# Shared pool for fanning out independent upstream calls inside a fetcher.
+# Only leaf network calls go on it — never submit work that itself waits on _POOL.
+_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="pokealpha")
+atexit.register(_POOL.shutdown)
 
 # ─── In-memory cache ────────────────────────────────────────────────────────
 
-_cache: dict[str, tuple[float, any]] = {}
+# Bounded LRU with per-entry expiry; lookups reorder the LRU, so reads lock too
+_cache = TTLCache(maxsize=10_000, ttl=CACHE_TTL)
+_cache_lock = threading.RLock()
 
 
 def cache_get(key: str):
-    if key in _cache:
-        ts, data = _cache[key]
-        if time.time() - ts < CACHE_TTL:
-            return data
-    return None
+    with _cache_lock:
+        return _cache.get(key)
 
 
 def cache_set(key: str, data):
-    _cache[key] = (time.time(), data)
+    with _cache_lock:
+        _cache[key] = data
+
+
+# Serialized-response cache: keeps the encoded JSON next to the data so hot
+# endpoints skip re-serializing the same payload on every hit.
+
+def cache_get_json(key: str) -> Optional[bytes]:
+    entry = cache_get(f"json:{key}")
+    return entry[1] if entry else None
+
+
+def cache_set_json(key: str, data) -> bytes:
+    body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    cache_set(f"json:{key}", (data, body))
+    return body
 
 
 # ─── Data models ─────────────────────────────────────────────────────────────
 
-@dataclass
+# Instances are built by the hundred per request, so models use __slots__, and
+# low-cardinality label strings are interned to share one object per value.
+# Responses use the handwritten to_dict() rather than asdict(), which recurses
+# and deep-copies every field; it also leaves out the derived *_lc fields.
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class CardPrice:
     card_id: str
     name: str
@@ -92,8 +240,36 @@ class CardPrice:
     bgs_95_price: Optional[float] = None
     cgc_10_price: Optional[float] = None
 
+    def __post_init__(self):
+        self.set_name = _intern(self.set_name)
+        self.rarity = _intern(self.rarity)
+        self.card_type = _intern(self.card_type)
+
+    def to_dict(self) -> dict:
+        return {
+            "card_id": self.card_id,
+            "name": self.name,
+            "set_name": self.set_name,
+            "number": self.number,
+            "rarity": self.rarity,
+            "card_type": self.card_type,
+            "image_url": self.image_url,
+            "tcgplayer_price": self.tcgplayer_price,
+            "tcgplayer_url": self.tcgplayer_url,
+            "ebay_sold_avg": self.ebay_sold_avg,
+            "ebay_sold_low": self.ebay_sold_low,
+            "ebay_sold_high": self.ebay_sold_high,
+            "price_30d_ago": self.price_30d_ago,
+            "price_90d_ago": self.price_90d_ago,
+            "low_52w": self.low_52w,
+            "high_52w": self.high_52w,
+            "psa_10_price": self.psa_10_price,
+            "bgs_95_price": self.bgs_95_price,
+            "cgc_10_price": self.cgc_10_price,
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SentimentPost:
     platform: str  # "reddit" | "youtube"
     title: str
@@ -105,9 +281,31 @@ class SentimentPost:
     sentiment: float = 0.5  # 0-1 polarity
     timestamp: str = ""
     mentioned_cards: list = field(default_factory=list)
+    # Lowercased once here so alpha scoring never re-lowers them per card
+    title_lc: str = field(init=False, repr=False, compare=False)
+    mentioned_cards_lc: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "platform", _intern(self.platform))
+        object.__setattr__(self, "title_lc", self.title.lower())
+        object.__setattr__(self, "mentioned_cards_lc", tuple(m.lower() for m in self.mentioned_cards))
+
+    def to_dict(self) -> dict:
+        return {
+            "platform": self.platform,
+            "title": self.title,
+            "author": self.author,
+            "url": self.url,
+            "score": self.score,
+            "comments": self.comments,
+            "views": self.views,
+            "sentiment": self.sentiment,
+            "timestamp": self.timestamp,
+            "mentioned_cards": list(self.mentioned_cards),
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LeakArticle:
     source: str  # "PokeBeach" | "PokemonBlog" | "Pokemon.com"
     title: str
@@ -116,6 +314,23 @@ class LeakArticle:
     date: str
     impact: str = "medium"  # "high" | "medium" | "low"
     mentioned_pokemon: list = field(default_factory=list)
+    mentioned_pokemon_lc: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "source", _intern(self.source))
+        object.__setattr__(self, "impact", _intern(self.impact))
+        object.__setattr__(self, "mentioned_pokemon_lc", tuple(p.lower() for p in self.mentioned_pokemon))
+
+    def to_dict(self) -> dict:
+        return {
+            "source": self.source,
+            "title": self.title,
+            "url": self.url,
+            "summary": self.summary,
+            "date": self.date,
+            "impact": self.impact,
+            "mentioned_pokemon": list(self.mentioned_pokemon),
+        }
 
 
 # ─── Pokemon TCG API (pokemontcg.io) ────────────────────────────────────────
@@ -123,6 +338,25 @@ class LeakArticle:
 POKEMONTCG_BASE = "https://api.pokemontcg.io/v2"
 
 
+# List responses only feed extract_pricing, so only ask for the fields it reads
+# (a fraction of the full card objects)
+CARD_LIST_FIELDS = "id,name,supertype,set,number,rarity,types,images,tcgplayer"
+
+
+@lru_cache(maxsize=256)
+def _cards_params(query: str, page: int, page_size: int) -> tuple:
+    """Query params for a /cards listing, memoized for repeat pages."""
+    params = {
+        "page": page,
+        "pageSize": page_size,
+        "orderBy": "-set.releaseDate",
+        "select": CARD_LIST_FIELDS,
+    }
+    if query:
+        params["q"] = query
+    return tuple(params.items())
+
+
 def fetch_cards(query: str = "", page: int = 1, page_size: int = 50) -> list[dict]:
     """Fetch cards from pokemontcg.io with optional search query."""
     key = f"cards:{query}:{page}:{page_size}"
@@ -130,14 +364,14 @@ def fetch_cards(query: str = "", page: int = 1, page_size: int = 50) -> list[dic
     if cached:
         return cached
 
-    params = {"page": page, "pageSize": page_size, "orderBy": "-set.releaseDate"}
-    if query:
-        params["q"] = query
-
     try:
-        resp = requests.get(f"{POKEMONTCG_BASE}/cards", params=params, timeout=15)
+        resp = SESSION.get(
+            f"{POKEMONTCG_BASE}/cards",
+            params=dict(_cards_params(query, page, page_size)),
+            timeout=HTTP_TIMEOUT,
+        )
         resp.raise_for_status()
-        data = resp.json().get("data", [])
+        data = _json_loads(resp.content).get("data", [])
         cache_set(key, data)
         return data
     except Exception as e:
@@ -153,9 +387,9 @@ def fetch_card_by_id(card_id: str) -> Optional[dict]:
         return cached
 
     try:
-        resp = requests.get(f"{POKEMONTCG_BASE}/cards/{card_id}", timeout=10)
+        resp = SESSION.get(f"{POKEMONTCG_BASE}/cards/{card_id}", timeout=HTTP_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json().get("data")
+        data = _json_loads(resp.content).get("data")
         cache_set(key, data)
         return data
     except Exception as e:
@@ -164,7 +398,24 @@ def fetch_card_by_id(card_id: str) -> Optional[dict]:
 
 
 def extract_pricing(card_data: dict) -> CardPrice:
-    """Extract US pricing info from a pokemontcg.io card response."""
+    """Extract US pricing info from a pokemontcg.io card response.
+
+    Memoized per card id for CACHE_TTL — the scanner and the card pages keep
+    re-extracting the same cards. Callers get their own copy, since enrichment
+    fills in the US pricing fields in place.
+    """
+    card_id = card_data.get("id", "")
+    key = f"pricing:{card_id}"
+    cached = cache_get(key) if card_id else None
+    if cached:
+        return copy.copy(cached)
+    price = _extract_pricing(card_data)
+    if card_id:
+        cache_set(key, copy.copy(price))
+    return price
+
+
+def _extract_pricing(card_data: dict) -> CardPrice:
     tcg_prices = card_data.get("tcgplayer", {}).get("prices", {})
 
     # Find the best price variant (holofoil > reverseHolofoil > normal)
@@ -229,14 +480,14 @@ def fetch_poketrace_card(card_name: str, set_name: str = "") -> Optional[dict]:
         return cached
 
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             f"{POKETRACE_BASE}/cards",
             params={"search": search, "market": "US"},  # US only — no EU/Cardmarket
             headers={"X-API-Key": POKETRACE_API_KEY},
-            timeout=10,
+            timeout=HTTP_TIMEOUT,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
 
         # PokeTrace returns a list of matches; take the best one
         results = data if isinstance(data, list) else data.get("data", data.get("results", []))
@@ -255,80 +506,77 @@ def fetch_poketrace_card(card_name: str, set_name: str = "") -> Optional[dict]:
         return None
 
 
+def _lane_paths(lanes: list[tuple], fields: tuple) -> list[tuple]:
+    """Paths trying each field of each lane, then the lane itself as a bare number."""
+    paths = []
+    for lane in lanes:
+        paths.extend(lane + (f,) for f in fields)
+        paths.append(lane)
+    return paths
+
+
+def _graded_lanes(*grade_keys: str) -> list[tuple]:
+    return [(group, k) for group in ("graded", "grades") for k in grade_keys]
+
+
+# Result key → candidate paths into a PokeTrace price block, best first.
+# Covers the response shapes seen so far plus legacy flat field names.
+_POKETRACE_FIELDS = {
+    "tcgplayer": _lane_paths([("tcgplayer",), ("tcg",)], ("market", "average", "mid"))
+                 + [("tcgplayer_price",)],
+    "ebay_sold_avg": _lane_paths([("ebay",), ("ebay_sold",)], ("average", "avg", "market"))
+                     + [("ebay_price",), ("ebay_average",)],
+    "ebay_sold_low": [(lane, f) for lane in ("ebay", "ebay_sold") for f in ("low", "min")],
+    "ebay_sold_high": [(lane, f) for lane in ("ebay", "ebay_sold") for f in ("high", "max")],
+    "psa10": _lane_paths(_graded_lanes("psa_10", "PSA 10", "psa10"), ("average", "market", "price"))
+             + [("psa_10",)],
+    "bgs95": _lane_paths(_graded_lanes("bgs_9.5", "BGS 9.5", "bgs95"), ("average", "market", "price"))
+             + [("bgs_9_5",)],
+    "cgc10": _lane_paths(_graded_lanes("cgc_10", "CGC 10", "cgc10"), ("average", "market", "price"))
+             + [("cgc_10",)],
+}
+
+
+def _probe(d, path: tuple) -> Optional[float]:
+    """Follow a key path through nested dicts; return a non-zero number or None."""
+    for k in path:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(k)
+        if d is None:
+            return None
+    if isinstance(d, (int, float)) and not isinstance(d, bool) and d:
+        return float(d)
+    return None
+
+
 def extract_poketrace_pricing(pt_data: dict) -> dict:
     """Extract US-only pricing fields from a PokeTrace response.
     Adapts to whatever field names PokeTrace returns.
     Returns { tcgplayer, ebay_sold_avg, ebay_sold_low, ebay_sold_high,
               psa10, bgs95, cgc10 }.
     """
-    result = {
-        "tcgplayer": None, "ebay_sold_avg": None, "ebay_sold_low": None,
-        "ebay_sold_high": None, "psa10": None, "bgs95": None, "cgc10": None,
-    }
-
+    result = dict.fromkeys(_POKETRACE_FIELDS)
     if not pt_data:
         return result
 
-    # PokeTrace field extraction — adapt to actual API response shape
     # Common patterns: prices.tcgplayer.market, prices.ebay.average, etc.
-    prices = pt_data.get("prices", pt_data)
-
-    # TCGPlayer pricing
-    tcg = prices.get("tcgplayer", prices.get("tcg", {}))
-    if isinstance(tcg, dict):
-        result["tcgplayer"] = tcg.get("market") or tcg.get("average") or tcg.get("mid")
-    elif isinstance(tcg, (int, float)):
-        result["tcgplayer"] = float(tcg)
-
-    # eBay sold pricing (US only since we passed market=US)
-    ebay = prices.get("ebay", prices.get("ebay_sold", {}))
-    if isinstance(ebay, dict):
-        result["ebay_sold_avg"] = ebay.get("average") or ebay.get("avg") or ebay.get("market")
-        result["ebay_sold_low"] = ebay.get("low") or ebay.get("min")
-        result["ebay_sold_high"] = ebay.get("high") or ebay.get("max")
-    elif isinstance(ebay, (int, float)):
-        result["ebay_sold_avg"] = float(ebay)
-
-    # Graded pricing
-    graded = prices.get("graded", prices.get("grades", {}))
-    if isinstance(graded, dict):
-        # Try PSA 10
-        psa = graded.get("psa_10") or graded.get("PSA 10") or graded.get("psa10")
-        if isinstance(psa, dict):
-            result["psa10"] = psa.get("average") or psa.get("market") or psa.get("price")
-        elif isinstance(psa, (int, float)):
-            result["psa10"] = float(psa)
-
-        # Try BGS 9.5
-        bgs = graded.get("bgs_9.5") or graded.get("BGS 9.5") or graded.get("bgs95")
-        if isinstance(bgs, dict):
-            result["bgs95"] = bgs.get("average") or bgs.get("market") or bgs.get("price")
-        elif isinstance(bgs, (int, float)):
-            result["bgs95"] = float(bgs)
-
-        # Try CGC 10
-        cgc = graded.get("cgc_10") or graded.get("CGC 10") or graded.get("cgc10")
-        if isinstance(cgc, dict):
-            result["cgc10"] = cgc.get("average") or cgc.get("market") or cgc.get("price")
-        elif isinstance(cgc, (int, float)):
-            result["cgc10"] = float(cgc)
-
-    # Also check top-level fields as fallback
-    for field_name, result_key in [
-        ("tcgplayer_price", "tcgplayer"), ("ebay_price", "ebay_sold_avg"),
-        ("ebay_average", "ebay_sold_avg"), ("psa_10", "psa10"),
-        ("bgs_9_5", "bgs95"), ("cgc_10", "cgc10"),
-    ]:
-        if result[result_key] is None and field_name in prices:
-            val = prices[field_name]
-            if isinstance(val, (int, float)):
-                result[result_key] = float(val)
+    prices = pt_data.get("prices") or pt_data
+    for result_key, paths in _POKETRACE_FIELDS.items():
+        for path in paths:
+            value = _probe(prices, path)
+            if value is not None:
+                result[result_key] = value
+                break
 
     return result
 
 
 # ─── eBay Sold Listings (fallback scraping if PokeTrace unavailable) ─────────
 
+_EBAY_PRICE_RE = re.compile(r"\$(\d+[\d,.]*)")
+
+
 def _scrape_ebay_sold(search_query: str, min_price: int = 5) -> dict:
     """Scrape eBay recently sold listings as a fallback.
     Returns { avg, low, high, count }.
@@ -341,33 +589,37 @@ def _scrape_ebay_sold(search_query: str, min_price: int = 5) -> dict:
     try:
         query = search_query.replace(" ", "+")
         url = f"https://www.ebay.com/sch/i.html?_nkw={query}&_sop=13&LH_Sold=1&LH_Complete=1&_udlo={min_price}"
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = EBAY_SESSION.get(url, timeout=HTTP_TIMEOUT, stream=True)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        html = _read_capped(resp)
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        # Only build tree nodes for the price spans; the rest of the page is skipped
+        strainer = SoupStrainer(class_="s-item__price")
+        soup = BeautifulSoup(html, "lxml", parse_only=strainer)
 
         prices = []
-        for item in soup.select(".s-item__price"):
-            text = item.get_text(strip=True)
-            matches = re.findall(r"\$(\d+[\d,.]*)", text)
-            for m in matches:
-                try:
-                    prices.append(float(m.replace(",", "")))
-                except ValueError:
-                    continue
+        for m in _EBAY_PRICE_RE.findall(soup.get_text(" ")):
+            try:
+                prices.append(float(m.replace(",", "")))
+            except ValueError:
+                continue
 
         if not prices:
             return {"avg": None, "low": None, "high": None, "count": 0}
 
-        prices.sort()
-        trim = max(1, len(prices) // 10)
-        trimmed = prices[trim:-trim] if len(prices) > 5 else prices
+        # Drop IQR outliers (lot sales, $1 scams); small samples are kept whole
+        arr = np.array(prices, dtype=np.float64)
+        q1, q3 = np.percentile(arr, [25, 75])
+        iqr = q3 - q1
+        mask = (arr >= q1 - 1.5 * iqr) & (arr <= q3 + 1.5 * iqr)
+        kept = arr[mask] if mask.sum() >= 5 else arr
 
         result = {
-            "avg": round(sum(trimmed) / len(trimmed), 2),
-            "low": round(trimmed[0], 2),
-            "high": round(trimmed[-1], 2),
-            "count": len(prices),
+            "avg": round(float(kept.mean()), 2),
+            "low": round(float(kept.min()), 2),
+            "high": round(float(kept.max()), 2),
+            "count": int(arr.size),
         }
         cache_set(key, result)
         return result
@@ -383,6 +635,10 @@ PRICECHARTING_API_KEY = os.getenv("PRICECHARTING_API_KEY", "")
 
 # ─── Unified US Pricing: PokeTrace → PriceCharting → eBay scrape ─────────────
 
+def _us_pricing_key(card_name: str, set_name: str) -> str:
+    return f"us_pricing:{card_name}:{set_name}"
+
+
 def fetch_us_pricing(card_name: str, set_name: str = "") -> dict:
     """Fetch all US pricing for a card using this priority chain:
       1. PokeTrace API (TCGPlayer + eBay sold + graded, market=US)
@@ -392,7 +648,7 @@ def fetch_us_pricing(card_name: str, set_name: str = "") -> dict:
     Returns { tcgplayer, ebay_sold_avg, ebay_sold_low, ebay_sold_high,
               psa10, bgs95, cgc10, source }.
     """
-    key = f"us_pricing:{card_name}:{set_name}"
+    key = _us_pricing_key(card_name, set_name)
     cached = cache_get(key)
     if cached:
         return cached
@@ -420,13 +676,13 @@ def fetch_us_pricing(card_name: str, set_name: str = "") -> dict:
             search = f"Pokemon {card_name}"
             if set_name:
                 search += f" {set_name}"
-            resp = requests.get(
+            resp = SESSION.get(
                 "https://www.pricecharting.com/api/product",
                 params={"t": PRICECHARTING_API_KEY, "q": search},
-                timeout=10,
+                timeout=HTTP_TIMEOUT,
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = _json_loads(resp.content)
                 if "graded-price" in data and not result["psa10"]:
                     result["psa10"] = data["graded-price"] / 100.0
                 if "manual-only-price" in data and not result["bgs95"]:
@@ -443,33 +699,62 @@ def fetch_us_pricing(card_name: str, set_name: str = "") -> dict:
     if set_name:
         search_base += f" {set_name}"
 
+    # (result key, eBay search, min price) for everything still missing
+    scrapes = []
     if not result["ebay_sold_avg"]:
-        ebay = _scrape_ebay_sold(search_base, min_price=5)
-        if ebay["avg"]:
-            result["ebay_sold_avg"] = ebay["avg"]
-            result["ebay_sold_low"] = ebay["low"]
-            result["ebay_sold_high"] = ebay["high"]
-            result["source"] = result["source"].replace("none", "") + "+ebay_scrape" if result["source"] != "none" else "ebay_scrape"
-
+        scrapes.append(("ebay_sold_avg", search_base, 5))
     if not result["psa10"]:
-        psa = _scrape_ebay_sold(f"{search_base} PSA 10", min_price=10)
-        result["psa10"] = psa["avg"]
+        scrapes.append(("psa10", f"{search_base} PSA 10", 10))
     if not result["bgs95"]:
-        bgs = _scrape_ebay_sold(f"{search_base} BGS 9.5", min_price=10)
-        result["bgs95"] = bgs["avg"]
+        scrapes.append(("bgs95", f"{search_base} BGS 9.5", 10))
     if not result["cgc10"]:
-        cgc = _scrape_ebay_sold(f"{search_base} CGC 10", min_price=10)
-        result["cgc10"] = cgc["avg"]
+        scrapes.append(("cgc10", f"{search_base} CGC 10", 10))
+
+    # Scrapes are independent — run them concurrently (never raises)
+    futures = {
+        _POOL.submit(_scrape_ebay_sold, search, min_price): result_key
+        for result_key, search, min_price in scrapes
+    }
+    for future in as_completed(futures):
+        result_key = futures[future]
+        scraped = future.result()
+        if result_key != "ebay_sold_avg":
+            result[result_key] = scraped["avg"]
+        elif scraped["avg"]:
+            result["ebay_sold_avg"] = scraped["avg"]
+            result["ebay_sold_low"] = scraped["low"]
+            result["ebay_sold_high"] = scraped["high"]
+            result["source"] = result["source"].replace("none", "") + "+ebay_scrape" if result["source"] != "none" else "ebay_scrape"
 
     result["source"] = result["source"].strip("+") or "ebay_scrape"
-    cache_set(key, result)
+    if result["source"] != "none":  # don't pin a total miss for the whole TTL
+        cache_set(key, result)
     return result
 
 
-def enrich_with_us_pricing(card_price: CardPrice) -> CardPrice:
-    """Enrich a CardPrice with full US market data (PokeTrace → fallbacks)."""
-    pricing = fetch_us_pricing(card_price.name, card_price.set_name)
-
+def fetch_us_pricing_batch(queries: list[tuple[str, str]], max_workers: int = 8) -> dict:
+    """Fetch US pricing for many (card_name, set_name) pairs concurrently.
+    Returns { (card_name, set_name): pricing dict }.
+    """
+    out = {}
+    pending = []
+    for query in dict.fromkeys(queries):
+        cached = cache_get(_us_pricing_key(*query))
+        if cached:
+            out[query] = cached
+        else:
+            pending.append(query)
+
+    if pending:
+        # Own executor: fetch_us_pricing itself waits on _POOL
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = {executor.submit(fetch_us_pricing, *query): query for query in pending}
+            for future in as_completed(futures):
+                out[futures[future]] = future.result()
+    return out
+
+
+def _apply_us_pricing(card_price: CardPrice, pricing: dict) -> CardPrice:
     # Raw pricing
     card_price.ebay_sold_avg = pricing["ebay_sold_avg"]
     card_price.ebay_sold_low = pricing["ebay_sold_low"]
@@ -487,36 +772,56 @@ def enrich_with_us_pricing(card_price: CardPrice) -> CardPrice:
     return card_price
 
 
+def enrich_with_us_pricing(card_price: CardPrice) -> CardPrice:
+    """Enrich a CardPrice with full US market data (PokeTrace → fallbacks)."""
+    pricing = fetch_us_pricing(card_price.name, card_price.set_name)
+    return _apply_us_pricing(card_price, pricing)
+
+
+def enrich_with_us_pricing_batch(card_prices: list[CardPrice]) -> list[CardPrice]:
+    """Enrich many CardPrices at once, fetching each distinct card/set pair concurrently."""
+    pricing = fetch_us_pricing_batch([(c.name, c.set_name) for c in card_prices])
+    for card_price in card_prices:
+        _apply_us_pricing(card_price, pricing[(card_price.name, card_price.set_name)])
+    return card_prices
+
+
 # ─── Reddit Sentiment ────────────────────────────────────────────────────────
 
 REDDIT_SUBREDDITS = ["PokemonTCG", "pokemoncardcollectors", "PokeInvesting"]
 
+# App-only OAuth token, kept until shortly before Reddit says it expires
+_REDDIT_TOKEN = {"token": None, "exp": 0.0}
+_reddit_token_lock = threading.Lock()
+
 
 def _get_reddit_token() -> Optional[str]:
     """Get OAuth token for Reddit API."""
     if not REDDIT_CLIENT_ID or not REDDIT_CLIENT_SECRET:
         return None
 
-    key = "reddit_token"
-    cached = cache_get(key)
-    if cached:
-        return cached
+    with _reddit_token_lock:
+        if time.time() < _REDDIT_TOKEN["exp"] - 60:
+            return _REDDIT_TOKEN["token"]
 
-    try:
-        resp = requests.post(
-            "https://www.reddit.com/api/v1/access_token",
-            auth=(REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET),
-            data={"grant_type": "client_credentials"},
-            headers={"User-Agent": REDDIT_USER_AGENT},
-            timeout=10,
-        )
-        resp.raise_for_status()
-        token = resp.json().get("access_token")
-        cache_set(key, token)
-        return token
-    except Exception as e:
-        LOG.error(f"Reddit auth error: {e}")
-        return None
+        try:
+            resp = SESSION.post(
+                "https://www.reddit.com/api/v1/access_token",
+                auth=(REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET),
+                data={"grant_type": "client_credentials"},
+                headers={"User-Agent": REDDIT_USER_AGENT},
+                timeout=HTTP_TIMEOUT,
+            )
+            resp.raise_for_status()
+            token_resp = _json_loads(resp.content)
+            token = token_resp.get("access_token")
+            if token:
+                _REDDIT_TOKEN["token"] = token
+                _REDDIT_TOKEN["exp"] = time.time() + token_resp.get("expires_in", 3600)
+            return token
+        except Exception as e:
+            LOG.error(f"Reddit auth error: {e}")
+            return None
 
 
 def fetch_reddit_sentiment(card_name: str = "", limit: int = 25) -> list[SentimentPost]:
@@ -531,66 +836,116 @@ def fetch_reddit_sentiment(card_name: str = "", limit: int = 25) -> list[Sentime
         LOG.warning("Reddit API not configured — set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET")
         return []
 
+    # Subreddits are independent — fetch them concurrently on the shared pool
     posts = []
-    headers = {"Authorization": f"Bearer {token}", "User-Agent": REDDIT_USER_AGENT}
-
-    for sub in REDDIT_SUBREDDITS:
-        try:
-            params = {"limit": limit, "t": "week"}
-            if card_name:
-                params["q"] = card_name
-                url = f"https://oauth.reddit.com/r/{sub}/search"
-                params["restrict_sr"] = "on"
-                params["sort"] = "relevance"
-            else:
-                url = f"https://oauth.reddit.com/r/{sub}/hot"
-
-            resp = requests.get(url, headers=headers, params=params, timeout=10)
-            if resp.status_code != 200:
-                continue
-
-            for child in resp.json().get("data", {}).get("children", []):
-                d = child.get("data", {})
-                title = d.get("title", "")
-
-                # Simple sentiment analysis (keyword-based)
-                sentiment = _simple_sentiment(title + " " + d.get("selftext", "")[:500])
-
-                posts.append(SentimentPost(
-                    platform="reddit",
-                    title=title,
-                    author=f"u/{d.get('author', 'unknown')}",
-                    url=f"https://reddit.com{d.get('permalink', '')}",
-                    score=d.get("score", 0),
-                    comments=d.get("num_comments", 0),
-                    sentiment=sentiment,
-                    timestamp=datetime.fromtimestamp(d.get("created_utc", 0)).isoformat(),
-                    mentioned_cards=_extract_card_mentions(title),
-                ))
-        except Exception as e:
-            LOG.error(f"Reddit error for r/{sub}: {e}")
+    for sub_posts in _POOL.map(
+        lambda sub: _fetch_reddit_subreddit(sub, token, card_name, limit), REDDIT_SUBREDDITS
+    ):
+        posts.extend(sub_posts)
 
     posts.sort(key=lambda p: p.score, reverse=True)
     cache_set(key, posts[:limit])
     return posts[:limit]
 
 
+def _fetch_reddit_subreddit(sub: str, token: str, card_name: str, limit: int) -> list[SentimentPost]:
+    """Fetch one subreddit's hot listing, or its search results for card_name."""
+    headers = {"Authorization": f"Bearer {token}", "User-Agent": REDDIT_USER_AGENT}
+    posts = []
+    try:
+        params = {"limit": limit, "t": "week"}
+        if card_name:
+            params["q"] = card_name
+            url = f"https://oauth.reddit.com/r/{sub}/search"
+            params["restrict_sr"] = "on"
+            params["sort"] = "relevance"
+        else:
+            url = f"https://oauth.reddit.com/r/{sub}/hot"
+
+        resp = SESSION.get(url, headers=headers, params=params, timeout=HTTP_TIMEOUT)
+        if resp.status_code != 200:
+            return posts
+
+        for child in _json_loads(resp.content).get("data", {}).get("children", []):
+            d = child.get("data", {})
+            title = d.get("title", "")
+
+            # Simple sentiment analysis (keyword-based)
+            sentiment = _simple_sentiment(title + " " + d.get("selftext", "")[:500])
+
+            posts.append(SentimentPost(
+                platform="reddit",
+                title=title,
+                author=f"u/{d.get('author', 'unknown')}",
+                url=f"https://reddit.com{d.get('permalink', '')}",
+                score=d.get("score", 0),
+                comments=d.get("num_comments", 0),
+                sentiment=sentiment,
+                timestamp=datetime.fromtimestamp(d.get("created_utc", 0)).isoformat(),
+                mentioned_cards=_extract_card_mentions(title),
+            ))
+    except Exception as e:
+        LOG.error(f"Reddit error for r/{sub}: {e}")
+    return posts
+
+
+def _alternation(words: list[str]) -> str:
+    """Regex alternation of literal keywords, longest first so phrases beat their prefixes."""
+    return "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+
+
+def _keyword_re(words: list[str], flags: int = 0) -> re.Pattern:
+    """Compile keywords into one alternation anchored at a word start.
+    There is no trailing boundary, so inflections like "buying" still match.
+    """
+    return re.compile(r"\b(" + _alternation(words) + ")", flags)
+
+
+_POSITIVE_WORDS = [
+    "undervalued", "buy", "invest", "bullish", "gem", "sleeper", "amazing",
+    "beautiful", "love", "great", "awesome", "incredible", "spike", "moon",
+    "gain", "profit", "deal", "steal", "rare", "grail", "fire", "must have",
+]
+_NEGATIVE_WORDS = [
+    "overvalued", "sell", "crash", "dump", "bearish", "scam", "overpriced",
+    "reprint", "fake", "drop", "decline", "loss", "bubble", "waste", "avoid",
+    "disappointed", "horrible", "terrible", "bad",
+]
+_POSITIVE_RE = _keyword_re(_POSITIVE_WORDS)
+_NEGATIVE_RE = _keyword_re(_NEGATIVE_WORDS)
+
+_KNOWN_POKEMON = [
+    "Charizard", "Pikachu", "Umbreon", "Lugia", "Mew", "Mewtwo", "Rayquaza",
+    "Giratina", "Arceus", "Gardevoir", "Gengar", "Eevee", "Iono", "Miraidon",
+    "Koraidon", "Sylveon", "Espeon", "Vaporeon", "Jolteon", "Flareon",
+]
+
+
+def _name_automaton(names) -> ahocorasick.Automaton:
+    """Aho–Corasick automaton over lowercased names, yielding the original name.
+    Finds every name in one linear scan of a text, however many names there are.
+    """
+    automaton = ahocorasick.Automaton()
+    for name in names:
+        automaton.add_word(name.lower(), name)
+    automaton.make_automaton()
+    return automaton
+
+
+_CARD_AUTOMATON = _name_automaton(_KNOWN_POKEMON)
+
+
 def _simple_sentiment(text: str) -> float:
     """Quick keyword-based sentiment scoring (0 = negative, 1 = positive)."""
     text = text.lower()
-    positive = [
-        "undervalued", "buy", "invest", "bullish", "gem", "sleeper", "amazing",
-        "beautiful", "love", "great", "awesome", "incredible", "spike", "moon",
-        "gain", "profit", "deal", "steal", "rare", "grail", "fire", "must have",
-    ]
-    negative = [
-        "overvalued", "sell", "crash", "dump", "bearish", "scam", "overpriced",
-        "reprint", "fake", "drop", "decline", "loss", "bubble", "waste", "avoid",
-        "disappointed", "horrible", "terrible", "bad",
-    ]
+    # Each keyword counts once, however often it repeats
+    pos_count = len(set(_POSITIVE_RE.findall(text)))
+    neg_count = len(set(_NEGATIVE_RE.findall(text)))
+    return _sentiment_score(pos_count, neg_count)
 
-    pos_count = sum(1 for w in positive if w in text)
-    neg_count = sum(1 for w in negative if w in text)
+
+@lru_cache(maxsize=None)  # counts are bounded by the keyword lists, so this stays tiny
+def _sentiment_score(pos_count: int, neg_count: int) -> float:
     total = pos_count + neg_count
     if total == 0:
         return 0.55  # Slightly positive default for collector communities
@@ -598,13 +953,15 @@ def _simple_sentiment(text: str) -> float:
 
 
 def _extract_card_mentions(text: str) -> list[str]:
-    """Extract Pokemon card names from text."""
-    known = [
-        "Charizard", "Pikachu", "Umbreon", "Lugia", "Mew", "Mewtwo", "Rayquaza",
-        "Giratina", "Arceus", "Gardevoir", "Gengar", "Eevee", "Iono", "Miraidon",
-        "Koraidon", "Sylveon", "Espeon", "Vaporeon", "Jolteon", "Flareon",
-    ]
-    return [name for name in known if name.lower() in text.lower()]
+    """Extract Pokemon card names from text, in order of first mention."""
+    text = text.lower()
+    found = {}
+    # Longest match wins ("Mewtwo" over "Mew"); matches must start a word
+    for end, name in _CARD_AUTOMATON.iter_long(text):
+        start = end - len(name) + 1
+        if start == 0 or not text[start - 1].isalnum():
+            found[name] = None
+    return list(found)
 
 
 # ─── YouTube API ─────────────────────────────────────────────────────────────
@@ -630,9 +987,9 @@ def fetch_youtube_sentiment(query: str = "Pokemon TCG", max_results: int = 10) -
             "key": YOUTUBE_API_KEY,
             "publishedAfter": (datetime.utcnow() - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ"),
         }
-        resp = requests.get("https://www.googleapis.com/youtube/v3/search", params=params, timeout=10)
+        resp = SESSION.get("https://www.googleapis.com/youtube/v3/search", params=params, timeout=HTTP_TIMEOUT)
         resp.raise_for_status()
-        items = resp.json().get("items", [])
+        items = _json_loads(resp.content).get("items", [])
 
         posts = []
         for item in items:
@@ -680,34 +1037,53 @@ def fetch_leak_news() -> list[LeakArticle]:
     if cached:
         return cached
 
+    fetchers = [_fetch_pokemonblog_rss, _fetch_pokebeach, _fetch_pokemon_official]
     articles = []
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {
-            executor.submit(_fetch_pokemonblog_rss): "PokemonBlog",
-            executor.submit(_fetch_pokebeach): "PokeBeach",
-            executor.submit(_fetch_pokemon_official): "Pokemon.com",
-        }
-        for future in as_completed(futures):
-            source = futures[future]
-            try:
-                result = future.result()
-                articles.extend(result)
-            except Exception as e:
-                LOG.error(f"Leak fetch error for {source}: {e}")
+    for result in _POOL.map(_safe_fetch, fetchers):
+        articles.extend(result)
 
     articles.sort(key=lambda a: a.date, reverse=True)
     cache_set(key, articles)
     return articles
 
 
+def _safe_fetch(fetcher) -> list[LeakArticle]:
+    """Run one leak fetcher, turning any escaped error into an empty result."""
+    try:
+        return fetcher()
+    except Exception as e:
+        LOG.error(f"Leak fetch error in {fetcher.__name__}: {e}")
+        return []
+
+
+# Validators from the last feed download, for conditional GETs
+_FEED_META = {"pokemonblog": {"etag": None, "modified": None, "articles": None}}
+
+
 def _fetch_pokemonblog_rss() -> list[LeakArticle]:
-    """Fetch from PokemonBlog RSS feed."""
+    """Fetch from PokemonBlog RSS feed; unchanged feeds are served from the last parse."""
+    meta = _FEED_META["pokemonblog"]
     try:
-        feed = feedparser.parse("https://pokemonblog.com/feed")
+        headers = {}
+        if meta["articles"] is not None:
+            if meta["etag"]:
+                headers["If-None-Match"] = meta["etag"]
+            if meta["modified"]:
+                headers["If-Modified-Since"] = meta["modified"]
+
+        resp = SESSION.get(LEAK_SOURCES["PokemonBlog"]["rss"], headers=headers, timeout=HTTP_TIMEOUT)
+        if resp.status_code == 304:
+            return meta["articles"]
+        resp.raise_for_status()
+
+        import feedparser
+        from bs4 import BeautifulSoup
+
+        feed = feedparser.parse(resp.content)
         articles = []
         for entry in feed.entries[:15]:
             title = entry.get("title", "")
-            summary = BeautifulSoup(entry.get("summary", ""), "html.parser").get_text()[:300]
+            summary = BeautifulSoup(entry.get("summary", ""), "lxml").get_text()[:300]
             impact = _assess_impact(title, summary)
             pokemon = _extract_card_mentions(title + " " + summary)
 
@@ -720,6 +1096,10 @@ def _fetch_pokemonblog_rss() -> list[LeakArticle]:
                 impact=impact,
                 mentioned_pokemon=pokemon,
             ))
+
+        meta["etag"] = resp.headers.get("ETag")
+        meta["modified"] = resp.headers.get("Last-Modified")
+        meta["articles"] = articles
         return articles
     except Exception as e:
         LOG.error(f"PokemonBlog RSS error: {e}")
@@ -729,10 +1109,12 @@ def _fetch_pokemonblog_rss() -> list[LeakArticle]:
 def _fetch_pokebeach() -> list[LeakArticle]:
     """Scrape PokeBeach front page for news."""
     try:
-        headers = {"User-Agent": "Mozilla/5.0 (compatible; PokéAlpha/1.0)"}
-        resp = requests.get("https://www.pokebeach.com/", headers=headers, timeout=15)
+        resp = SESSION.get("https://www.pokebeach.com/", timeout=HTTP_TIMEOUT, stream=True)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        html = _read_capped(resp)
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "lxml")
 
         articles = []
         # PokeBeach uses article tags or specific div classes
@@ -768,10 +1150,12 @@ def _fetch_pokebeach() -> list[LeakArticle]:
 def _fetch_pokemon_official() -> list[LeakArticle]:
     """Scrape Pokemon.com for official news."""
     try:
-        headers = {"User-Agent": "Mozilla/5.0 (compatible; PokéAlpha/1.0)"}
-        resp = requests.get("https://www.pokemon.com/us/pokemon-news", headers=headers, timeout=15)
+        resp = SESSION.get("https://www.pokemon.com/us/pokemon-news", timeout=HTTP_TIMEOUT, stream=True)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        html = _read_capped(resp)
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "lxml")
 
         articles = []
         for item in soup.select("a[href*='/pokemon-news/']")[:15]:
@@ -802,145 +1186,337 @@ def _fetch_pokemon_official() -> list[LeakArticle]:
         return []
 
 
+_HIGH_IMPACT = [
+    "new set", "reveal", "leaked", "ban", "rotation", "reprint",
+    "championship", "special art", "secret rare", "illustration rare",
+    "new expansion", "release date", "errata",
+]
+_MEDIUM_IMPACT = [
+    "tournament", "deck", "strategy", "meta", "price",
+    "collection", "promo", "event",
+]
+_HIGH_IMPACT_RE = _keyword_re(_HIGH_IMPACT, re.IGNORECASE)
+_IMPACT_RE = re.compile(
+    rf"\b(?:(?P<high>{_alternation(_HIGH_IMPACT)})|(?P<medium>{_alternation(_MEDIUM_IMPACT)}))",
+    re.IGNORECASE,
+)
+
+
 def _assess_impact(title: str, summary: str) -> str:
     """Assess the market impact of a news article."""
-    text = (title + " " + summary).lower()
-    high_impact = [
-        "new set", "reveal", "leaked", "ban", "rotation", "reprint",
-        "championship", "special art", "secret rare", "illustration rare",
-        "new expansion", "release date", "errata",
-    ]
-    medium_impact = [
-        "tournament", "deck", "strategy", "meta", "price",
-        "collection", "promo", "event",
-    ]
-
-    if any(kw in text for kw in high_impact):
-        return "high"
-    if any(kw in text for kw in medium_impact):
-        return "medium"
-    return "low"
+    impact = "low"
+    for text in (title, summary):  # most hits are in the title
+        m = _IMPACT_RE.search(text)
+        if m is None:
+            continue
+        # A medium hit only needs the rest of the text checked for a high one
+        if m.lastgroup == "high" or _HIGH_IMPACT_RE.search(text, m.end()):
+            return "high"
+        impact = "medium"
+    return impact
 
 
 # ─── Alpha Score Computation ─────────────────────────────────────────────────
 
-def compute_alpha_score(
-    card_price: CardPrice,
+def _price_column(card_prices: list[CardPrice], attr: str) -> np.ndarray:
+    """One CardPrice field as a float64 vector, missing values as 0."""
+    return np.fromiter(
+        (getattr(c, attr) or 0.0 for c in card_prices), dtype=np.float64, count=len(card_prices)
+    )
+
+
+def price_alpha_scores(card_prices: list[CardPrice]) -> np.ndarray:
+    """Price Alpha (0–100) for a batch of cards in one vectorized pass.
+
+    Scores rise when the current US price sits below its 30/90-day averages,
+    when TCGPlayer and eBay disagree by more than 15%, and when the price is
+    near the bottom of its 52-week range.
+    """
+    tcg, ebay, p30, p90, lo52, hi52 = (
+        _price_column(card_prices, attr) for attr in
+        ("tcgplayer_price", "ebay_sold_avg", "price_30d_ago", "price_90d_ago", "low_52w", "high_52w")
+    )
+    current = np.where(tcg != 0, tcg, ebay)
+    priced = current > 0
+    current = np.where(priced, current, 1.0)  # placeholder keeps unpriced rows finite
+
+    avg30 = np.where(p30 != 0, p30, current)
+    avg90 = np.where(p90 != 0, p90, current)
+    pct_below_30d = np.where(avg30 > 0, (avg30 - current) / np.where(avg30 > 0, avg30, 1.0) * 100, 0.0)
+    pct_below_90d = np.where(avg90 > 0, (avg90 - current) / np.where(avg90 > 0, avg90, 1.0) * 100, 0.0)
+
+    score = np.full(len(card_prices), 50.0)
+    score += np.clip(pct_below_30d * 1.5, -25, 25)
+    score += np.clip(pct_below_90d * 0.8, -15, 15)
+
+    # Price spread across US sources
+    both = (tcg != 0) & (ebay != 0)
+    low = np.minimum(tcg, ebay)
+    spread = (np.maximum(tcg, ebay) - low) / np.where(low != 0, low, 1.0) * 100
+    score += np.where(both & (spread > 15), 5, 0)
+
+    # 52-week range position
+    ranged = (lo52 != 0) & (hi52 > lo52)
+    range_pct = (current - lo52) / np.where(ranged, hi52 - lo52, 1.0) * 100
+    score += np.where(ranged & (range_pct < 30), 10, 0)
+    score -= np.where(ranged & (range_pct > 80), 10, 0)
+
+    score = np.where(priced, score, 50.0)
+    return np.clip(np.rint(score), 0, 100).astype(np.int64)
+
+
+def _index_mentions(automaton: ahocorasick.Automaton, items: list, texts_of) -> dict[str, list]:
+    """Map each matched name to the items (in feed order) whose texts contain it."""
+    index = defaultdict(list)
+    for item in items:
+        names = {name for text in texts_of(item) for _, name in automaton.iter(text)}
+        for name in names:
+            index[name].append(item)
+    return index
+
+
+def _post_texts(post: SentimentPost) -> tuple[str, ...]:
+    return (post.title_lc, *post.mentioned_cards_lc)
+
+
+def _leak_texts(leak: LeakArticle) -> tuple[str, ...]:
+    return leak.mentioned_pokemon_lc
+
+
+def mention_index(
+    card_names: list[str],
     reddit_posts: list[SentimentPost],
     youtube_posts: list[SentimentPost],
     leaks: list[LeakArticle],
+) -> tuple[dict, dict, dict]:
+    """Index the feeds by which card names they mention, in one scan per text.
+
+    Returns (reddit, youtube, leaks) dicts keyed by lowercased card name. A post
+    counts when the name appears in its title or mentioned cards; a leak when it
+    appears in its mentioned Pokemon.
+    """
+    names = {name.lower() for name in card_names if name}
+    if not names:
+        return {}, {}, {}
+    automaton = _name_automaton(names)
+    return (
+        _index_mentions(automaton, reddit_posts, _post_texts),
+        _index_mentions(automaton, youtube_posts, _post_texts),
+        _index_mentions(automaton, leaks, _leak_texts),
+    )
+
+
+# (score key, threshold, signal text) — a signal fires when the score reaches it
+_SIGNALS = (
+    ("price_alpha", 70, "Price below moving averages"),
+    ("sentiment_score", 70, "Strong positive community sentiment"),
+    ("leak_catalyst", 60, "Upcoming catalyst from leaks/news"),
+)
+
+DEFAULT_WEIGHTS = {"price": 0.40, "sentiment": 0.35, "leak": 0.25}
+
+
+def relevant_mentions(indexes: tuple[dict, dict, dict], card_name: str) -> tuple[list, list, list]:
+    """This card's (reddit, youtube, leaks) slices of a mention_index result."""
+    name = card_name.lower()
+    return tuple(index.get(name, []) for index in indexes)
+
+
+def _alpha_kernel(
+    price_score: np.ndarray,
+    reddit_count: np.ndarray,
+    youtube_count: np.ndarray,
+    avg_sentiment: np.ndarray,
+    leak_count: np.ndarray,
+    high_leak_count: np.ndarray,
+    weights: dict,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sentiment, Leak Catalyst and Combined scores (int64, 0–100) for a batch of cards."""
+    # ── Sentiment Score (0–100) ──
+    sentiment = 50 + np.minimum(reddit_count * 5, 20) + np.minimum(youtube_count * 3, 10)
+    sentiment = sentiment + np.where(reddit_count > 0, (avg_sentiment - 0.5) * 40, 0.0)
+    sentiment = np.clip(np.rint(sentiment), 0, 100).astype(np.int64)
+
+    # ── Leak Catalyst (0–100) ──
+    leak = np.clip(40 + leak_count * 8 + high_leak_count * 10, 0, 100)
+
+    # ── Combined ──
+    # Accumulated in place, in the scalar formula's order: a BLAS dot/matmul
+    # sums differently and flips scores that land on a .5 rounding tie
+    combined = np.multiply(price_score, weights["price"], dtype=np.float64)
+    combined += sentiment * weights["sentiment"]
+    combined += leak * weights["leak"]
+    combined = np.rint(combined, out=combined).astype(np.int64)
+    return sentiment, leak, combined
+
+
+def alpha_scores(
+    card_prices: list[CardPrice],
+    mentions: list[tuple[list, list, list]],
     weights: dict = None,
-) -> dict:
+) -> list[dict]:
     """
-    Compute the combined Alpha Score for a card.
+    Compute the combined Alpha Score for a batch of cards.
 
-    Returns: { price_alpha, sentiment_score, leak_catalyst, combined, signals }
+    mentions — per card, its (reddit, youtube, leaks) feeds already narrowed
+               to posts/leaks mentioning it (see relevant_mentions).
+
+    Returns, per card: { price_alpha, sentiment_score, leak_catalyst, combined, signals, ... }
     """
     if weights is None:
-        weights = {"price": 0.40, "sentiment": 0.35, "leak": 0.25}
-
-    # ── Price Alpha (0–100) ──
-    price_score = 50
-    current = card_price.tcgplayer_price or card_price.ebay_sold_avg or 0
-    if current > 0:
-        avg30 = card_price.price_30d_ago or current
-        avg90 = card_price.price_90d_ago or current
-
-        pct_below_30d = ((avg30 - current) / avg30) * 100 if avg30 > 0 else 0
-        pct_below_90d = ((avg90 - current) / avg90) * 100 if avg90 > 0 else 0
-
-        price_score += min(25, max(-25, pct_below_30d * 1.5))
-        price_score += min(15, max(-15, pct_below_90d * 0.8))
-
-        # Price spread across US sources
-        prices = [p for p in [card_price.tcgplayer_price, card_price.ebay_sold_avg] if p]
-        if len(prices) > 1:
-            spread = (max(prices) - min(prices)) / min(prices) * 100
-            if spread > 15:
-                price_score += 5
-
-        # 52-week range position
-        if card_price.low_52w and card_price.high_52w and card_price.high_52w > card_price.low_52w:
-            range_pct = (current - card_price.low_52w) / (card_price.high_52w - card_price.low_52w) * 100
-            if range_pct < 30:
-                price_score += 10
-            elif range_pct > 80:
-                price_score -= 10
-
-    price_score = max(0, min(100, round(price_score)))
+        weights = DEFAULT_WEIGHTS
+    price_scores = price_alpha_scores(card_prices)
+
+    n = len(card_prices)
+    # One pass over the mention slices gathers every per-card input
+    counts, sentiments = [], []
+    for reddit, youtube, leaks in mentions:
+        high_impact = 0
+        for leak in leaks:
+            if leak.impact == "high":
+                high_impact += 1
+        counts.append((len(reddit), len(youtube), len(leaks), high_impact))
+        sentiments.append(sum(p.sentiment for p in reddit) / len(reddit) if reddit else 0.5)
+    reddit_count, youtube_count, leak_count, high_leak_count = np.array(counts, dtype=np.int64).reshape(n, 4).T
+    avg_sentiment = np.array(sentiments, dtype=np.float64)
+    sentiment, leak, combined = _alpha_kernel(
+        price_scores, reddit_count, youtube_count, avg_sentiment,
+        leak_count, high_leak_count, weights,
+    )
 
-    # ── Sentiment Score (0–100) ──
-    sentiment_score = 50
-    card_name_lower = card_price.name.lower()
+    # Signals stay in Python — string building gains nothing from vectorizing
+    results = []
+    for price, sent, lk, comb, n_reddit, n_youtube, n_leaks in zip(
+        price_scores.tolist(), sentiment.tolist(), leak.tolist(), combined.tolist(),
+        reddit_count.tolist(), youtube_count.tolist(), leak_count.tolist(),
+    ):
+        alpha = {
+            "price_alpha": price,
+            "sentiment_score": sent,
+            "leak_catalyst": lk,
+            "combined": comb,
+            "signals": [],
+            "reddit_mentions": n_reddit,
+            "youtube_mentions": n_youtube,
+            "leak_mentions": n_leaks,
+        }
+        alpha["signals"] = [text for score_key, threshold, text in _SIGNALS if alpha[score_key] >= threshold]
+        if n_leaks:
+            alpha["signals"].append(f"{n_leaks} related leak(s) found")
+        results.append(alpha)
+    return results
 
-    relevant_reddit = [p for p in reddit_posts if card_name_lower in p.title.lower() or
-                       any(card_name_lower in m.lower() for m in p.mentioned_cards)]
-    relevant_youtube = [p for p in youtube_posts if card_name_lower in p.title.lower() or
-                        any(card_name_lower in m.lower() for m in p.mentioned_cards)]
 
-    reddit_count = len(relevant_reddit)
-    youtube_count = len(relevant_youtube)
+def compute_alpha_score(
+    card_price: CardPrice,
+    relevant_reddit: list[SentimentPost],
+    relevant_youtube: list[SentimentPost],
+    relevant_leaks: list[LeakArticle],
+    weights: dict = None,
+) -> dict:
+    """Alpha Score for a single card — see alpha_scores."""
+    return alpha_scores([card_price], [(relevant_reddit, relevant_youtube, relevant_leaks)], weights)[0]
 
-    sentiment_score += min(20, reddit_count * 5)
-    sentiment_score += min(10, youtube_count * 3)
 
-    if relevant_reddit:
-        avg_sentiment = sum(p.sentiment for p in relevant_reddit) / len(relevant_reddit)
-        sentiment_score += (avg_sentiment - 0.5) * 40
+# ─── Feed Snapshot ───────────────────────────────────────────────────────────
 
-    sentiment_score = max(0, min(100, round(sentiment_score)))
+_NO_MENTIONS = ([], [], [])
 
-    # ── Leak Catalyst (0–100) ──
-    leak_score = 40
-    relevant_leaks = [l for l in leaks if any(
-        card_name_lower in p.lower() for p in l.mentioned_pokemon
-    )]
 
-    leak_score += len(relevant_leaks) * 8
-    high_impact_leaks = sum(1 for l in relevant_leaks if l.impact == "high")
-    leak_score += high_impact_leaks * 10
+class FeedSnapshot:
+    """The shared Reddit/YouTube/leak feeds that alpha scores are computed against.
+
+    Fetched once per CACHE_TTL and read by every scanner and card-alpha request;
+    a snapshot with an empty feed (likely an upstream miss) is only kept for
+    EMPTY_FEED_RETRY seconds so the outage isn't pinned for the full TTL. Per-card mention slices are indexed lazily, for names not seen yet, and kept
+    until the next refresh. `generation` changes with every refresh so derived
+    results can key on it instead of on the feeds.
+    """
 
-    leak_score = max(0, min(100, round(leak_score)))
+    __slots__ = ("reddit", "youtube", "leaks", "generation", "fetched_at", "ttl", "_mentions", "_lock")
 
-    # ── Combined ──
-    combined = round(
-        price_score * weights["price"] +
-        sentiment_score * weights["sentiment"] +
-        leak_score * weights["leak"]
-    )
+    def __init__(self, reddit: list[SentimentPost], youtube: list[SentimentPost],
+                 leaks: list[LeakArticle], generation: int):
+        self.reddit = reddit
+        self.youtube = youtube
+        self.leaks = leaks
+        self.generation = generation
+        self.fetched_at = time.time()
+        self.ttl = CACHE_TTL if reddit and youtube and leaks else min(EMPTY_FEED_RETRY, CACHE_TTL)
+        self._mentions: dict[str, tuple[list, list, list]] = {}
+        self._lock = threading.Lock()
 
-    signals = []
-    if price_score >= 70:
-        signals.append("Price below moving averages")
-    if sentiment_score >= 70:
-        signals.append("Strong positive community sentiment")
-    if leak_score >= 60:
-        signals.append("Upcoming catalyst from leaks/news")
-    if relevant_leaks:
-        signals.append(f"{len(relevant_leaks)} related leak(s) found")
-
-    return {
-        "price_alpha": price_score,
-        "sentiment_score": sentiment_score,
-        "leak_catalyst": leak_score,
-        "combined": combined,
-        "signals": signals,
-        "reddit_mentions": reddit_count,
-        "youtube_mentions": youtube_count,
-        "leak_mentions": len(relevant_leaks),
-    }
+    def mentions(self, card_names: list[str]) -> dict[str, tuple[list, list, list]]:
+        """(reddit, youtube, leaks) slices mentioning each card, keyed by lowercased name."""
+        names = {name.lower() for name in card_names if name}
+        with self._lock:
+            missing = names - self._mentions.keys()
+        if missing:
+            indexes = mention_index(missing, self.reddit, self.youtube, self.leaks)
+            with self._lock:
+                for name in missing:
+                    self._mentions[name] = relevant_mentions(indexes, name)
+        return self._mentions
+
+
+EMPTY_FEED_RETRY = 30  # seconds before a snapshot with an empty feed is refetched
+
+_snapshot: Optional[FeedSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def _fetch_snapshot(generation: int) -> FeedSnapshot:
+    # Own executor: the feed fetchers wait on _POOL themselves
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        reddit_future = executor.submit(fetch_reddit_sentiment, "", 50)
+        youtube_future = executor.submit(fetch_youtube_sentiment, "Pokemon TCG", 20)
+        leaks_future = executor.submit(fetch_leak_news)
+        return FeedSnapshot(reddit_future.result(), youtube_future.result(), leaks_future.result(), generation)
+
+
+def feed_snapshot() -> FeedSnapshot:
+    """The current feed snapshot, refetched once it is older than its ttl."""
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is None or time.time() - snapshot.fetched_at > snapshot.ttl:
+        with _snapshot_lock:
+            if _snapshot is snapshot:  # not already refreshed by another request
+                _snapshot = _fetch_snapshot(snapshot.generation + 1 if snapshot else 0)
+            snapshot = _snapshot
+    return snapshot
 
 
 # ─── Flask API ───────────────────────────────────────────────────────────────
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for request bodies and any jsonify use."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 
+def json_response(body: bytes, status: int = 200):
+    """Wrap already-encoded JSON in a response without another serialize pass."""
+    return app.response_class(body, status=status, mimetype="application/json")
+
+
+def ojson(obj, status: int = 200):
+    """jsonify() replacement that encodes straight to bytes, skipping the str round-trip."""
+    return json_response(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), status)
+
+
 @app.route("/api/health")
 def health():
     """Health check with status of all data sources."""
-    return jsonify({
+    return ojson({
         "status": "ok",
         "timestamp": datetime.now().isoformat(),
         "region": "USA / North America",
@@ -968,10 +1544,17 @@ def api_cards():
       q      — search query (e.g. "Charizard ex")
       page   — page number (default 1)
       limit  — results per page (default 20, max 50)
+      enrich — "true" to add eBay sold comps + graded pricing (default false)
     """
     q = request.args.get("q", "")
     page = int(request.args.get("page", 1))
     limit = min(50, int(request.args.get("limit", 20)))
+    enrich = request.args.get("enrich", "false").lower() == "true"
+
+    key = f"api:cards:{q}:{page}:{limit}:{enrich}"
+    body = cache_get_json(key)
+    if body:
+        return json_response(body)
 
     # Build query for pokemontcg.io
     search = ""
@@ -979,12 +1562,15 @@ def api_cards():
         search = f'name:"{q}"'
 
     raw_cards = fetch_cards(query=search, page=page, page_size=limit)
-    results = []
-    for card_data in raw_cards:
-        price = extract_pricing(card_data)
-        results.append(asdict(price))
+    prices = [extract_pricing(card_data) for card_data in raw_cards]
+    if enrich:
+        prices = enrich_with_us_pricing_batch(prices)
+    results = [price.to_dict() for price in prices]
 
-    return jsonify({"cards": results, "page": page, "total": len(results)})
+    payload = {"cards": results, "page": page, "total": len(results)}
+    if not results:  # likely an upstream miss — don't pin it
+        return ojson(payload)
+    return json_response(cache_set_json(key, payload))
 
 
 @app.route("/api/cards/<card_id>")
@@ -992,7 +1578,7 @@ def api_card_detail(card_id):
     """Get detailed card info with US pricing from TCGPlayer + eBay + graded."""
     card_data = fetch_card_by_id(card_id)
     if not card_data:
-        return jsonify({"error": "Card not found"}), 404
+        return ojson({"error": "Card not found"}, 404)
 
     price = extract_pricing(card_data)
 
@@ -1001,8 +1587,8 @@ def api_card_detail(card_id):
     if enrich:
         price = enrich_with_us_pricing(price)
 
-    return jsonify({
-        "card": asdict(price),
+    return ojson({
+        "card": price.to_dict(),
         "raw": {
             "pokemontcg": card_data,
         }
@@ -1014,21 +1600,11 @@ def api_card_alpha(card_id):
     """Compute Alpha Score for a specific card."""
     card_data = fetch_card_by_id(card_id)
     if not card_data:
-        return jsonify({"error": "Card not found"}), 404
+        return ojson({"error": "Card not found"}, 404)
 
     price = extract_pricing(card_data)
     card_name = card_data.get("name", "")
 
-    # Fetch all data sources in parallel
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        reddit_future = executor.submit(fetch_reddit_sentiment, card_name, 25)
-        youtube_future = executor.submit(fetch_youtube_sentiment, f"Pokemon TCG {card_name}", 10)
-        leaks_future = executor.submit(fetch_leak_news)
-
-        reddit_posts = reddit_future.result()
-        youtube_posts = youtube_future.result()
-        leaks = leaks_future.result()
-
     # Parse weights from query params
     weights = {
         "price": float(request.args.get("w_price", 0.40)),
@@ -1036,14 +1612,56 @@ def api_card_alpha(card_id):
         "leak": float(request.args.get("w_leak", 0.25)),
     }
 
-    alpha = compute_alpha_score(price, reddit_posts, youtube_posts, leaks, weights)
+    mentions = feed_snapshot().mentions([card_name])
+    alpha = compute_alpha_score(price, *mentions.get(card_name.lower(), _NO_MENTIONS), weights)
 
-    return jsonify({
-        "card": asdict(price),
+    return ojson({
+        "card": price.to_dict(),
         "alpha": alpha,
     })
 
 
+def _scan_cards(prices: list[CardPrice], snapshot: FeedSnapshot, weights: dict) -> list[dict]:
+    """Score the scanner cards against the feed snapshot.
+
+    Scores are cached per card, price inputs, snapshot generation and weights, so
+    repeat scans over unchanged data skip scoring entirely; the misses are
+    scored together in one alpha_scores batch.
+    """
+    keys = [
+        f"alpha:{price.card_id}:{price.tcgplayer_price}:{price.ebay_sold_avg}:"
+        f"{price.price_30d_ago}:{price.price_90d_ago}:{price.low_52w}:{price.high_52w}:{snapshot.generation}:"
+        f"{weights['price']!r}:{weights['sentiment']!r}:{weights['leak']!r}"
+        for price in prices
+    ]
+    alphas = [cache_get(key) for key in keys]
+    misses = [i for i, alpha in enumerate(alphas) if alpha is None]
+    if misses:
+        missed = [prices[i] for i in misses]
+        mentions = snapshot.mentions([price.name for price in missed])
+        scored = alpha_scores(missed, [mentions.get(price.name.lower(), _NO_MENTIONS) for price in missed], weights)
+        for i, alpha in zip(misses, scored):
+            cache_set(keys[i], alpha)
+            alphas[i] = alpha
+    return [{"card": price.to_dict(), "alpha": alpha} for price, alpha in zip(prices, alphas)]
+
+
+# Popular cards the scanner covers when no q filter is given
+SCANNER_SEARCHES = ("Charizard ex", "Pikachu VMAX", "Umbreon VMAX", "Lugia V", "Mew ex",
+                    "Iono", "Gardevoir ex", "Giratina VSTAR", "Miraidon ex", "Eevee")
+
+# sort param → (key from a card's CardPrice and alpha, descending?)
+_SCANNER_SORTS = {
+    "alpha": (lambda price, alpha: alpha["combined"], True),
+    "price": (lambda price, alpha: price.tcgplayer_price or 0, True),
+    "sentiment": (lambda price, alpha: alpha["sentiment_score"], True),
+    "dip": (
+        lambda price, alpha: ((price.tcgplayer_price or 0) - (price.price_30d_ago or 0)) / (price.price_30d_ago or 1),
+        False,
+    ),
+}
+
+
 @app.route("/api/scanner")
 def api_scanner():
     """Run the Alpha Scanner across popular/trending cards.
@@ -1070,48 +1688,48 @@ def api_scanner():
         "leak": float(request.args.get("w_leak", 0.25)),
     }
 
-    # Fetch cards — use popular search terms for the scanner
-    searches = ["Charizard ex", "Pikachu VMAX", "Umbreon VMAX", "Lugia V", "Mew ex",
-                "Iono", "Gardevoir ex", "Giratina VSTAR", "Miraidon ex", "Eevee"]
-    if q:
-        searches = [q]
-
-    all_cards = []
-    for name in searches:
-        raw = fetch_cards(query=f'name:"{name}" rarity:"Special Art Rare" OR rarity:"Illustration Rare" OR rarity:"Secret Rare"', page_size=5)
-        all_cards.extend(raw)
-
-    # Fetch sentiment & leaks once
-    reddit_posts = fetch_reddit_sentiment(limit=50)
-    youtube_posts = fetch_youtube_sentiment(max_results=20)
-    leaks = fetch_leak_news()
+    # Fetch cards — use popular search terms for the scanner; the default
+    # (unfiltered) scan reuses its merged card list while it is cached
+    searches = [q] if q else SCANNER_SEARCHES
+    all_cards = None if q else cache_get("scanner:cards")
+
+    snapshot = None
+    if all_cards is None:
+        # Card searches and the feed snapshot are independent — fetch them all at
+        # once (own executor: a snapshot refresh fans out on executors of its own)
+        with ThreadPoolExecutor(max_workers=len(searches) + 1) as executor:
+            snapshot_future = executor.submit(feed_snapshot)
+            batches = executor.map(
+                lambda name: fetch_cards(query=f'name:"{name}" rarity:"Special Art Rare" OR rarity:"Illustration Rare" OR rarity:"Secret Rare"', page_size=5),
+                searches,
+            )
+            all_cards = [card for batch in batches for card in batch]
+            snapshot = snapshot_future.result()
+        if all_cards and not q:
+            cache_set("scanner:cards", all_cards)
+
+    # Filter on type before any scoring; with nothing left there is no need to
+    # touch the feed snapshot at all
+    prices = [extract_pricing(card_data) for card_data in all_cards]
+    if card_type:
+        prices = [price for price in prices if price.card_type == card_type]
+    if not prices:
+        return ojson({"results": [], "total": 0})
+    if snapshot is None:
+        snapshot = feed_snapshot()
+
+    # Sort — keys are read off the CardPrice/alpha once per card, then ordered by
+    # a C-level itemgetter (stable, so ties keep scan order as before)
+    key_of, reverse = _SCANNER_SORTS.get(sort, (None, False))
+    ranked = [
+        (key_of(price, scored["alpha"]) if key_of else 0, scored)
+        for price, scored in zip(prices, _scan_cards(prices, snapshot, weights))
+        if scored["alpha"]["combined"] >= min_alpha
+    ]
+    ranked.sort(key=itemgetter(0), reverse=reverse)
+    results = [scored for _, scored in ranked]
 
-    results = []
-    for card_data in all_cards:
-        price = extract_pricing(card_data)
-        if card_type and price.card_type != card_type:
-            continue
-        alpha = compute_alpha_score(price, reddit_posts, youtube_posts, leaks, weights)
-        if alpha["combined"] >= min_alpha:
-            results.append({
-                "card": asdict(price),
-                "alpha": alpha,
-            })
-
-    # Sort
-    if sort == "alpha":
-        results.sort(key=lambda r: r["alpha"]["combined"], reverse=True)
-    elif sort == "price":
-        results.sort(key=lambda r: r["card"].get("tcgplayer_price") or 0, reverse=True)
-    elif sort == "sentiment":
-        results.sort(key=lambda r: r["alpha"]["sentiment_score"], reverse=True)
-    elif sort == "dip":
-        results.sort(key=lambda r: (
-            ((r["card"].get("tcgplayer_price") or 0) - (r["card"].get("price_30d_ago") or 0)) /
-            (r["card"].get("price_30d_ago") or 1)
-        ))
-
-    return jsonify({"results": results, "total": len(results)})
+    return ojson({"results": results, "total": len(results)})
 
 
 @app.route("/api/sentiment")
@@ -1128,14 +1746,14 @@ def api_sentiment():
     reddit = fetch_reddit_sentiment(q, limit)
     youtube = fetch_youtube_sentiment(f"Pokemon TCG {q}" if q else "Pokemon TCG", min(limit, 10))
 
-    all_posts = [asdict(p) for p in reddit + youtube]
+    all_posts = [p.to_dict() for p in reddit + youtube]
     all_posts.sort(key=lambda p: p.get("timestamp", ""), reverse=True)
 
     # Aggregate stats
     sentiments = [p["sentiment"] for p in all_posts if p["sentiment"]]
     avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0.5
 
-    return jsonify({
+    return ojson({
         "posts": all_posts[:limit],
         "stats": {
             "total_posts": len(all_posts),
@@ -1158,21 +1776,30 @@ def api_leaks():
     source = request.args.get("source", "")
     impact = request.args.get("impact", "")
 
+    key = f"api:leaks:{source}:{impact}"
+    body = cache_get_json(key)
+    if body:
+        return json_response(body)
+
     articles = fetch_leak_news()
     if source:
         articles = [a for a in articles if a.source == source]
     if impact:
         articles = [a for a in articles if a.impact == impact]
+    source_counts = Counter(a.source for a in articles)
 
-    return jsonify({
-        "articles": [asdict(a) for a in articles],
+    payload = {
+        "articles": [a.to_dict() for a in articles],
         "total": len(articles),
         "sources": {
-            "PokeBeach": sum(1 for a in articles if a.source == "PokeBeach"),
-            "PokemonBlog": sum(1 for a in articles if a.source == "PokemonBlog"),
-            "Pokemon.com": sum(1 for a in articles if a.source == "Pokemon.com"),
+            "PokeBeach": source_counts["PokeBeach"],
+            "PokemonBlog": source_counts["PokemonBlog"],
+            "Pokemon.com": source_counts["Pokemon.com"],
         },
-    })
+    }
+    if not articles:  # likely every source failing — don't pin it
+        return ojson(payload)
+    return json_response(cache_set_json(key, payload))
 
 
 @app.route("/api/cards/<card_id>/graded")
@@ -1183,7 +1810,7 @@ def api_card_graded(card_id):
     """
     card_data = fetch_card_by_id(card_id)
     if not card_data:
-        return jsonify({"error": "Card not found"}), 404
+        return ojson({"error": "Card not found"}, 404)
 
     card_name = card_data.get("name", "")
     set_name = card_data.get("set", {}).get("name", "")
@@ -1194,7 +1821,7 @@ def api_card_graded(card_id):
     price = extract_pricing(card_data)
     raw = price.tcgplayer_price or 0
 
-    return jsonify({
+    return ojson({
         "card_id": card_id,
         "card_name": card_name,
         "set_name": set_name,
@@ -1221,6 +1848,7 @@ if __name__ == "__main__":
     LOG.info("=" * 60)
     LOG.info(f"  Port:           {PORT}")
     LOG.info(f"  Cache TTL:      {CACHE_TTL}s")
+    LOG.info(f"  Server:         {SERVER}" + (f" ({SERVER_THREADS} threads)" if SERVER == "waitress" else " (debug)" if DEBUG else ""))
     LOG.info(f"  Region:         USA / North America only")
     LOG.info(f"  Reddit API:     {'Configured' if REDDIT_CLIENT_ID else 'Not configured'}")
     LOG.info(f"  YouTube API:    {'Configured' if YOUTUBE_API_KEY else 'Not configured'}")
@@ -1243,4 +1871,9 @@ if __name__ == "__main__":
     LOG.info("  GET /api/leaks              — Leak & news tracker")
     LOG.info("=" * 60)
 
-    app.run(host="0.0.0.0", port=PORT, debug=True)
+    if SERVER == "flask":
+        app.run(host="0.0.0.0", port=PORT, debug=DEBUG, use_reloader=DEBUG, threaded=True)
+    else:
+        from waitress import serve
+
+        serve(app, host="0.0.0.0", port=PORT, threads=SERVER_THREADS)
@@ -0,0 +1,208 @@
+"""Batch alpha scoring must match the original per-card scalar formula."""
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("HTTP_CACHE", os.path.join(tempfile.mkdtemp(), "pokealpha_http"))
+
+import backend  # noqa: E402
+from backend import CardPrice, LeakArticle, SentimentPost  # noqa: E402
+
+DEFAULT_WEIGHTS = {"price": 0.40, "sentiment": 0.35, "leak": 0.25}
+
+
+def baseline_alpha(card_price, reddit_posts, youtube_posts, leaks, weights=None):
+    """The scalar compute_alpha_score the batch path replaced, kept verbatim."""
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+
+    price_score = 50
+    current = card_price.tcgplayer_price or card_price.ebay_sold_avg or 0
+    if current > 0:
+        avg30 = card_price.price_30d_ago or current
+        avg90 = card_price.price_90d_ago or current
+
+        pct_below_30d = ((avg30 - current) / avg30) * 100 if avg30 > 0 else 0
+        pct_below_90d = ((avg90 - current) / avg90) * 100 if avg90 > 0 else 0
+
+        price_score += min(25, max(-25, pct_below_30d * 1.5))
+        price_score += min(15, max(-15, pct_below_90d * 0.8))
+
+        prices = [p for p in [card_price.tcgplayer_price, card_price.ebay_sold_avg] if p]
+        if len(prices) > 1:
+            spread = (max(prices) - min(prices)) / min(prices) * 100
+            if spread > 15:
+                price_score += 5
+
+        if card_price.low_52w and card_price.high_52w and card_price.high_52w > card_price.low_52w:
+            range_pct = (current - card_price.low_52w) / (card_price.high_52w - card_price.low_52w) * 100
+            if range_pct < 30:
+                price_score += 10
+            elif range_pct > 80:
+                price_score -= 10
+
+    price_score = max(0, min(100, round(price_score)))
+
+    sentiment_score = 50
+    card_name_lower = card_price.name.lower()
+
+    relevant_reddit = [p for p in reddit_posts if card_name_lower in p.title.lower() or
+                       any(card_name_lower in m.lower() for m in p.mentioned_cards)]
+    relevant_youtube = [p for p in youtube_posts if card_name_lower in p.title.lower() or
+                        any(card_name_lower in m.lower() for m in p.mentioned_cards)]
+
+    reddit_count = len(relevant_reddit)
+    youtube_count = len(relevant_youtube)
+
+    sentiment_score += min(20, reddit_count * 5)
+    sentiment_score += min(10, youtube_count * 3)
+
+    if relevant_reddit:
+        avg_sentiment = sum(p.sentiment for p in relevant_reddit) / len(relevant_reddit)
+        sentiment_score += (avg_sentiment - 0.5) * 40
+
+    sentiment_score = max(0, min(100, round(sentiment_score)))
+
+    leak_score = 40
+    relevant_leaks = [l for l in leaks if any(
+        card_name_lower in p.lower() for p in l.mentioned_pokemon
+    )]
+
+    leak_score += len(relevant_leaks) * 8
+    high_impact_leaks = sum(1 for l in relevant_leaks if l.impact == "high")
+    leak_score += high_impact_leaks * 10
+
+    leak_score = max(0, min(100, round(leak_score)))
+
+    combined = round(
+        price_score * weights["price"] +
+        sentiment_score * weights["sentiment"] +
+        leak_score * weights["leak"]
+    )
+
+    signals = []
+    if price_score >= 70:
+        signals.append("Price below moving averages")
+    if sentiment_score >= 70:
+        signals.append("Strong positive community sentiment")
+    if leak_score >= 60:
+        signals.append("Upcoming catalyst from leaks/news")
+    if relevant_leaks:
+        signals.append(f"{len(relevant_leaks)} related leak(s) found")
+
+    return {
+        "price_alpha": price_score,
+        "sentiment_score": sentiment_score,
+        "leak_catalyst": leak_score,
+        "combined": combined,
+        "signals": signals,
+        "reddit_mentions": reddit_count,
+        "youtube_mentions": youtube_count,
+        "leak_mentions": len(relevant_leaks),
+    }
+
+
+def card(name="Mew ex", **prices):
+    return CardPrice("id", name, "Set", "1", "Rare", "Psychic", "", **prices)
+
+
+def post(title, sentiment=0.5, mentioned=(), platform="reddit"):
+    return SentimentPost(platform, title, "author", "url", sentiment=sentiment, mentioned_cards=list(mentioned))
+
+
+def leak(mentioned, impact="medium"):
+    return LeakArticle("PokeBeach", "title", "url", "", "", impact, list(mentioned))
+
+
+def batch_alpha(cards, reddit, youtube, leaks, weights=None):
+    indexes = backend.mention_index([c.name for c in cards], reddit, youtube, leaks)
+    return backend.alpha_scores(cards, [backend.relevant_mentions(indexes, c.name) for c in cards], weights)
+
+
+class AlphaBaselineTest(unittest.TestCase):
+    def assertMatchesBaseline(self, cards, reddit=(), youtube=(), leaks=(), weights=None):
+        reddit, youtube, leaks = list(reddit), list(youtube), list(leaks)
+        expected = [baseline_alpha(c, reddit, youtube, leaks, weights) for c in cards]
+        self.assertEqual(batch_alpha(cards, reddit, youtube, leaks, weights), expected)
+        for c, exp in zip(cards, expected):
+            self.assertEqual(backend.compute_alpha_score(
+                c, *backend.relevant_mentions(backend.mention_index([c.name], reddit, youtube, leaks), c.name), weights,
+            ), exp)
+
+    def test_price_branches(self):
+        cards = [
+            card(),  # unpriced
+            card(ebay_sold_avg=40.0),  # eBay only
+            card(tcgplayer_price=10.0, ebay_sold_avg=20.0),  # spread > 15%
+            card(tcgplayer_price=10.0, ebay_sold_avg=11.0),  # spread < 15%
+            card(tcgplayer_price=10.0, price_30d_ago=20.0, price_90d_ago=30.0),  # clamped dip
+            card(tcgplayer_price=30.0, price_30d_ago=10.0, price_90d_ago=5.0),  # clamped rise
+            card(tcgplayer_price=12.0, low_52w=10.0, high_52w=40.0),  # near 52w low
+            card(tcgplayer_price=38.0, low_52w=10.0, high_52w=40.0),  # near 52w high
+            card(tcgplayer_price=20.0, low_52w=40.0, high_52w=10.0),  # inverted range
+            card(tcgplayer_price=20.0, low_52w=0.0, high_52w=40.0),  # missing low
+        ]
+        self.assertMatchesBaseline(cards)
+
+    def test_rounding_ties(self):
+        # sentiment 50 + 5 + (0.4 - 0.5) * 40 = 51, so combined = 25 + 25.5 → 50 (half to even)
+        reddit = [post("mew ex pull", sentiment=0.4)]
+        weights = {"price": 0.5, "sentiment": 0.5, "leak": 0.0}
+        self.assertMatchesBaseline([card()], reddit=reddit, weights=weights)
+        self.assertEqual(batch_alpha([card()], reddit, [], [], weights)[0]["combined"], 50)
+
+    def test_int_weights(self):
+        self.assertMatchesBaseline(
+            [card(), card(tcgplayer_price=5.0, price_30d_ago=9.0)], weights={"price": 1, "sentiment": 0, "leak": 0},
+        )
+
+    def test_mention_matching(self):
+        reddit = [post("Mewtwo ex is climbing"), post("pulled a mew ex", sentiment=0.9)]
+        youtube = [post("Mewtwo VSTAR opening", platform="youtube", mentioned=["Mewtwo"])]
+        leaks = [leak(["Mewtwo"], "high"), leak(["Mew ex"], "high"), leak(["Eevee"])]
+        cards = [card("Mew ex"), card("Mew"), card("Mewtwo"), card("Pikachu")]
+        self.assertMatchesBaseline(cards, reddit, youtube, leaks)
+
+        mew_ex, mew = batch_alpha(cards[:2], reddit, youtube, leaks)
+        self.assertEqual((mew_ex["reddit_mentions"], mew_ex["leak_mentions"]), (1, 1))
+        self.assertEqual((mew["reddit_mentions"], mew["youtube_mentions"], mew["leak_mentions"]), (2, 1, 2))
+
+        # Deliberate departure: the scalar code let a nameless card match every post
+        # ("" is a substring of anything); mention_index gives it no mentions
+        nameless = batch_alpha([card("")], reddit, youtube, leaks)[0]
+        self.assertEqual((nameless["reddit_mentions"], nameless["youtube_mentions"], nameless["leak_mentions"]), (0, 0, 0))
+
+    def test_random_batches(self):
+        rng = random.Random(7)
+        names = ["Charizard ex", "Pikachu VMAX", "Mew", "Mew ex", "Mewtwo", "Iono", "Eevee", "Lugia V"]
+        words = ["charizard", "ex", "CHARIZARD EX", "pikachu vmax", "mew", "mewtwo", "Iono's",
+                 "Eevee", "buy", "crash", "lugia v", "Lugia VSTAR"]
+        price_choices = [None, 0.0, 4.5, 5.0, 12.0, 50.0, 120.0]
+
+        def title():
+            return " ".join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+
+        for _ in range(50):
+            reddit = [post(title(), rng.random(), backend._extract_card_mentions(title())) for _ in range(40)]
+            youtube = [post(title(), rng.random(), platform="youtube") for _ in range(15)]
+            leaks = [leak(backend._extract_card_mentions(title()), rng.choice(["high", "medium", "low"]))
+                     for _ in range(10)]
+            cards = [
+                card(rng.choice(names), **{
+                    attr: rng.choice(price_choices) for attr in
+                    ("tcgplayer_price", "ebay_sold_avg", "price_30d_ago", "price_90d_ago", "low_52w", "high_52w")
+                })
+                for _ in range(30)
+            ]
+            weights = rng.choice([None, {"price": 0.5, "sentiment": 0.25, "leak": 0.25},
+                                  {"price": rng.random(), "sentiment": rng.random(), "leak": rng.random()}])
+            self.assertMatchesBaseline(cards, reddit, youtube, leaks, weights)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""The scrape byte cap must end the download early, not trim a fully read page."""
+
+import http.server
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("HTTP_CACHE", os.path.join(tempfile.mkdtemp(), "pokealpha_http"))
+
+import backend  # noqa: E402
+
+CHUNK = 64 * 1024
+CHUNKS = 48  # ~3 MB page
+CHUNK_DELAY = 0.05  # the full page takes ~2.4 s to send
+LIMIT = 128 * 1024
+
+
+class _SlowPage(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(CHUNK * CHUNKS))
+        self.end_headers()
+        try:
+            for _ in range(CHUNKS):
+                self.wfile.write(b"x" * CHUNK)
+                time.sleep(CHUNK_DELAY)
+        except OSError:
+            pass  # client hung up once it hit the cap
+
+    def log_message(self, *args):
+        pass
+
+
+class ScrapeCapTest(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SlowPage)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        # Treat the local server like the real scrape hosts (the session keeps
+        # a reference to the mapping, so the patch has to outlive the request)
+        patch = mock.patch.dict(backend.HTTP_CACHE_TTLS,
+                                {"127.0.0.1": backend.HTTP_CACHE_TTLS["www.pokebeach.com"]})
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.session = backend._make_session(backend.BROWSER_USER_AGENT)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_cap_ends_download_early(self):
+        start = time.monotonic()
+        resp = self.session.get(self.url, timeout=backend.HTTP_TIMEOUT, stream=True)
+        html = backend._read_capped(resp, limit=LIMIT)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(len(html), LIMIT)
+        self.assertLess(elapsed, CHUNKS * CHUNK_DELAY / 3)
+        self.assertFalse(self.session.cache.contains(url=self.url))
+
+    def test_scrape_hosts_skip_http_cache(self):
+        for host in ("www.ebay.com", "www.pokebeach.com", "www.pokemon.com"):
+            self.assertIs(backend.HTTP_CACHE_TTLS[host], backend.requests_cache.DO_NOT_CACHE)
+
+
+if __name__ == "__main__":
+    unittest.main()